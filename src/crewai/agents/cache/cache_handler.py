@@ -1,35 +1,93 @@
+import threading
+import time
+from collections import OrderedDict
+from hashlib import blake2b
 from typing import Optional
 
 
 class CacheHandler:
-    """Callback handler for tool usage."""
+    """Callback handler for tool usage.
 
-    _cache: dict = {}
+    One handler is shared by every agent in a crew and tool callbacks fire
+    from pool threads, so all mutations of the store are lock-guarded.
+    """
 
-    def __init__(self):
+    def __init__(self, maxsize: int = 4096, ttl: Optional[float] = 3600):
         """        Initialize the object.
 
+        Args:
+            maxsize (int): Maximum number of entries kept in the cache before
+                the least recently used ones are evicted.
+            ttl (Optional[float]): Time-to-live for entries in seconds, or
+                None to keep entries until they are evicted.
+
         Returns:
             None
         """
 
-        self._cache = {}
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._cache = OrderedDict()
+        self._expirations = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        """        Return the state of the handler without the lock.
+
+        Locks cannot be copied or pickled, and crew and agent defaults are
+        deep-copied by pydantic, so the lock is dropped here and recreated
+        in __setstate__.
+
+        Returns:
+            dict: The instance state minus the lock.
+        """
+
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        """        Restore the state of the handler and create a fresh lock.
+
+        Args:
+            state (dict): The instance state produced by __getstate__.
+
+        Returns:
+            None
+        """
+
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
 
     def add(self, tool, input, output):
         """        Add the output of a tool with the given input to the cache.
 
+        When the cache is full the least recently used entry is evicted, so
+        memory stays bounded regardless of how many distinct inputs a
+        long-running crew produces.
+
         Args:
             tool (str): The name of the tool.
             input (str): The input for the tool.
             output: The output generated by the tool.
         """
 
-        input = input.strip()
-        self._cache[f"{tool}-{input}"] = output
+        key = self._key(tool, input.strip())
+        with self._lock:
+            self._cache[key] = output
+            self._cache.move_to_end(key)
+            if self.ttl is not None:
+                self._expirations[key] = time.monotonic() + self.ttl
+            while len(self._cache) > self.maxsize:
+                oldest, _ = self._cache.popitem(last=False)
+                self._expirations.pop(oldest, None)
 
     def read(self, tool, input) -> Optional[str]:
         """        Read the cached data for the given tool and input.
 
+        Entries older than the configured time-to-live are treated as misses
+        and dropped, so stale tool outputs are never served.
+
         Args:
             tool: The tool for which the data is being read.
             input: The input for which the data is being read.
@@ -38,5 +96,32 @@ class CacheHandler:
             Optional[str]: The cached data for the given tool and input, or None if not found.
         """
 
-        input = input.strip()
-        return self._cache.get(f"{tool}-{input}")
+        key = self._key(tool, input.strip())
+        with self._lock:
+            if key not in self._cache:
+                return None
+            expiration = self._expirations.get(key)
+            if expiration is not None and expiration < time.monotonic():
+                self._cache.pop(key, None)
+                self._expirations.pop(key, None)
+                return None
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+    @staticmethod
+    def _key(tool, input) -> bytes:
+        """        Build the cache key for the given tool and input.
+
+        The pair is hashed once into a fixed-size digest so lookups do not
+        re-hash the full input string, whose length grows with long tool
+        inputs, on every dict access.
+
+        Args:
+            tool (str): The name of the tool.
+            input (str): The stripped input for the tool.
+
+        Returns:
+            bytes: A 16-byte digest identifying the tool and input pair.
+        """
+
+        return blake2b(f"{tool}\x00{input}".encode(), digest_size=16).digest()
@@ -0,0 +1,153 @@
+import threading
+import time
+from typing import Optional
+
+from .cache_handler import CacheHandler
+
+
+class SemanticCacheHandler(CacheHandler):
+    """Cache handler that also matches semantically similar tool inputs.
+
+    Exact-match lookups are served from the in-memory dict first; on a miss
+    the input is embedded and compared against prior inputs for the same
+    tool, returning the stored output when the cosine similarity passes the
+    threshold. The semantic store honors the same maxsize and ttl bounds as
+    the base cache, so entries expire and are evicted on both layers, and
+    its per-tool index and parallel lists are lock-guarded since one handler
+    is shared across agents and pool threads. Requires the optional
+    `sentence-transformers` and `faiss-cpu` packages.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        model_name: str = "all-MiniLM-L6-v2",
+        maxsize: int = 4096,
+        ttl: Optional[float] = 3600,
+    ):
+        """        Initialize the semantic cache.
+
+        Args:
+            threshold (float): Minimum cosine similarity for a semantic hit.
+            model_name (str): Name of the sentence-transformers model used to
+                embed tool inputs.
+            maxsize (int): Maximum number of entries kept per tool before the
+                oldest ones are evicted.
+            ttl (Optional[float]): Time-to-live for entries in seconds, or
+                None to keep entries until they are evicted.
+
+        Raises:
+            ImportError: If the optional dependencies are not installed.
+        """
+
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        try:
+            import faiss
+            import numpy
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            raise ImportError(
+                "SemanticCacheHandler requires the `faiss-cpu` and "
+                "`sentence-transformers` packages, install them to use "
+                "semantic caching."
+            )
+        self._faiss = faiss
+        self._numpy = numpy
+        self.threshold = threshold
+        self._model = SentenceTransformer(model_name)
+        self._indexes = {}
+        self._outputs = {}
+        self._semantic_expirations = {}
+        self._semantic_lock = threading.Lock()
+
+    def add(self, tool, input, output):
+        """        Add the output of a tool with the given input to the cache.
+
+        The entry is stored in the exact-match cache and in the per-tool
+        vector index. When a tool's index grows past maxsize its oldest
+        entries are removed, keeping memory bounded like the base cache.
+
+        Args:
+            tool (str): The name of the tool.
+            input (str): The input for the tool.
+            output: The output generated by the tool.
+        """
+
+        super().add(tool, input, output)
+        vector = self._embed(input.strip())
+        with self._semantic_lock:
+            index = self._indexes.get(tool)
+            if index is None:
+                index = self._faiss.IndexFlatIP(vector.shape[1])
+                self._indexes[tool] = index
+                self._outputs[tool] = []
+                self._semantic_expirations[tool] = []
+            index.add(vector)
+            self._outputs[tool].append(output)
+            self._semantic_expirations[tool].append(
+                None if self.ttl is None else time.monotonic() + self.ttl
+            )
+            excess = len(self._outputs[tool]) - self.maxsize
+            if excess > 0:
+                index.remove_ids(self._numpy.arange(excess, dtype="int64"))
+                del self._outputs[tool][:excess]
+                del self._semantic_expirations[tool][:excess]
+
+    def read(self, tool, input) -> Optional[str]:
+        """        Read the cached data for the given tool and input.
+
+        Exact matches are checked first, then the input is embedded and the
+        closest prior input for the tool is looked up in the vector index.
+        A semantic match whose entry has outlived the time-to-live is
+        dropped and treated as a miss, so stale outputs are never served
+        from the vector index either.
+
+        Args:
+            tool: The tool for which the data is being read.
+            input: The input for which the data is being read.
+
+        Returns:
+            Optional[str]: The cached data for the given tool and input, or
+                None if no exact or semantic match is found.
+        """
+
+        output = super().read(tool, input)
+        if output is not None:
+            return output
+
+        if tool not in self._indexes:
+            return None
+
+        vector = self._embed(input.strip())
+        with self._semantic_lock:
+            index = self._indexes.get(tool)
+            if index is None:
+                return None
+
+            scores, positions = index.search(vector, 1)
+            position = int(positions[0][0])
+            if position == -1 or scores[0][0] < self.threshold:
+                return None
+
+            expiration = self._semantic_expirations[tool][position]
+            if expiration is not None and expiration < time.monotonic():
+                index.remove_ids(self._numpy.array([position], dtype="int64"))
+                del self._outputs[tool][position]
+                del self._semantic_expirations[tool][position]
+                return None
+            return self._outputs[tool][position]
+
+    def _embed(self, input):
+        """        Embed the input string as a normalized vector.
+
+        Embeddings are normalized once at encoding time so the inner-product
+        search is equivalent to cosine similarity.
+
+        Args:
+            input (str): The input string to embed.
+
+        Returns:
+            The embedding as a single-row float32 array.
+        """
+
+        return self._model.encode([input], normalize_embeddings=True).astype("float32")
@@ -1,15 +1,21 @@
+import re
+import sys
 from typing import Any, Dict
 
-from langchain.callbacks.base import BaseCallbackHandler
+from langchain_core.callbacks.base import BaseCallbackHandler
 
 from ..tools.cache_tools import CacheTools
 from .cache.cache_handler import CacheHandler
 
+_CACHE_TOOL_NAME = sys.intern(CacheTools().name)
+_ERROR_MARKERS = re.compile(
+    r"is not a valid tool|Invalid or incomplete response|Invalid Format"
+)
+
 
 class ToolsHandler(BaseCallbackHandler):
     """Callback handler for tool usage."""
 
-    last_used_tool: Dict[str, Any] = {}
     cache: CacheHandler
 
     def __init__(self, cache: CacheHandler, **kwargs: Any):
@@ -23,8 +29,26 @@ class ToolsHandler(BaseCallbackHandler):
             None
         """
         self.cache = cache
+        self._last_tool_name: str = ""
+        self._last_tool_input: str = ""
         super().__init__(**kwargs)
 
+    @property
+    def last_used_tool(self) -> Dict[str, Any]:
+        """        Return the last tool usage recorded by this handler.
+
+        The state is kept as two plain strings on the instance instead of a
+        shared class-level dict, so handlers no longer bleed the last usage
+        into each other and tool callbacks skip a dict allocation.
+
+        Returns:
+            Dict[str, Any]: The name and input of the last used tool, or an empty dict if none was recorded.
+        """
+
+        if not self._last_tool_name:
+            return {}
+        return {"tool": self._last_tool_name, "input": self._last_tool_input}
+
     def on_tool_start(
         self, serialized: Dict[str, Any], input_str: str, **kwargs: Any
     ) -> Any:
@@ -40,11 +64,8 @@ class ToolsHandler(BaseCallbackHandler):
         """
         name = serialized.get("name")
         if name not in ["invalid_tool", "_Exception"]:
-            tools_usage = {
-                "tool": name,
-                "input": input_str,
-            }
-            self.last_used_tool = tools_usage
+            self._last_tool_name = sys.intern(name) if name else ""
+            self._last_tool_input = input_str
 
     def on_tool_end(self, output: str, **kwargs: Any) -> Any:
         """        Run when tool ends running.
@@ -56,14 +77,10 @@ class ToolsHandler(BaseCallbackHandler):
         Returns:
             Any: The return value of the function.
         """
-        if (
-            "is not a valid tool" not in output
-            and "Invalid or incomplete response" not in output
-            and "Invalid Format" not in output
-        ):
-            if self.last_used_tool["tool"] != CacheTools().name:
+        if not _ERROR_MARKERS.search(output):
+            if self._last_tool_name is not _CACHE_TOOL_NAME:
                 self.cache.add(
-                    tool=self.last_used_tool["tool"],
-                    input=self.last_used_tool["input"],
+                    tool=self._last_tool_name,
+                    input=self._last_tool_input,
                     output=output,
                 )
@@ -1,24 +1,38 @@
-import threading
+import asyncio
+import os
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from typing import Any, List, Optional
 
-from pydantic import UUID4, BaseModel, Field, field_validator, model_validator
+from pydantic import (
+    UUID4,
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    field_validator,
+    model_validator,
+)
 from pydantic_core import PydanticCustomError
 
 from crewai.agent import Agent
 from crewai.tasks.task_output import TaskOutput
 from crewai.utilities import I18N
 
+_TASK_POOL = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4))
+
 
 class Task(BaseModel):
     """Class that represent a task to be executed."""
 
-    class Config:
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(arbitrary_types_allowed=True, defer_build=True)
 
     __hash__ = object.__hash__  # type: ignore
+    _future: Optional[Future] = PrivateAttr(default=None)
+    _prompt_cache: Optional[str] = PrivateAttr(default=None)
+    _context_cache: Optional[str] = PrivateAttr(default=None)
+    _context_cache_key: Optional[tuple] = PrivateAttr(default=None)
     i18n: I18N = I18N()
-    thread: threading.Thread = None
     description: str = Field(description="Description of the actual task.")
     callback: Optional[Any] = Field(
         description="Callback to be executed after the task is completed.", default=None
@@ -51,6 +65,35 @@ class Task(BaseModel):
         description="Unique identifier for the object, not set by user.",
     )
 
+    @property
+    def thread(self) -> Optional[Future]:
+        """        Compatibility alias for the future running this task.
+
+        Returns:
+            Optional[Future]: The future of the async execution, or None if the task was not submitted.
+        """
+
+        return self._future
+
+    def result(self, timeout: Optional[float] = None) -> str:
+        """        Block until the async execution of the task finishes and return its result.
+
+        Args:
+            timeout (float?): Seconds to wait for the result. Defaults to None.
+
+        Returns:
+            str: Output of the task.
+
+        Raises:
+            Exception: If the task was never submitted for async execution.
+        """
+
+        if self._future is None:
+            raise Exception(
+                f"The task '{self.description}' was not executed asynchronously, so there is no result to wait for."
+            )
+        return self._future.result(timeout)
+
     @field_validator("id", mode="before")
     @classmethod
     def _deny_user_set_id(cls, v: Optional[UUID4]) -> None:
@@ -113,20 +156,26 @@ class Task(BaseModel):
             )
 
         if self.context:
-            context = []
-            for task in self.context:
-                if task.async_execution:
-                    task.thread.join()
-                context.append(task.output.result)
-            context = "\n".join(context)
+            if self._context_cache_valid():
+                context = self._context_cache
+            else:
+                wait(
+                    [
+                        task._future
+                        for task in self.context
+                        if task.async_execution and task._future is not None
+                    ]
+                )
+                context = self._assemble_context()
+                self._context_cache = context
+                self._context_cache_key = self._context_key()
 
         tools = tools or self.tools
 
         if self.async_execution:
-            self.thread = threading.Thread(
-                target=self._execute, args=(agent, self._prompt(), context, tools)
+            self._future = _TASK_POOL.submit(
+                self._execute, agent, self._prompt(), context, tools
             )
-            self.thread.start()
         else:
             result = self._execute(
                 agent=agent,
@@ -136,6 +185,106 @@ class Task(BaseModel):
             )
             return result
 
+    async def aexecute(
+        self,
+        agent: Agent | None = None,
+        context: Optional[str] = None,
+        tools: Optional[List[Any]] = None,
+    ) -> str:
+        """        Execute the task on the asyncio event loop.
+
+        Pending context tasks are awaited concurrently and the blocking agent
+        call runs on the shared thread pool, so many tasks can be in flight on
+        a single event loop without tying up one thread each.
+
+        Args:
+            agent (Agent?): The agent to be used for execution. Defaults to None.
+            context (str?): The context for the task. Defaults to None.
+            tools (List[Any]?): The list of tools to be used. Defaults to None.
+
+        Returns:
+            str: Output of the task.
+
+        Raises:
+            Exception: If the task has no agent assigned and cannot be executed directly.
+        """
+
+        agent = agent or self.agent
+        if not agent:
+            raise Exception(
+                f"The task '{self.description}' has no agent assigned, therefore it can't be executed directly and should be executed in a Crew using a specific process that support that, like hierarchical."
+            )
+
+        if self.context:
+            if self._context_cache_valid():
+                context = self._context_cache
+            else:
+                await asyncio.gather(
+                    *[
+                        asyncio.wrap_future(task._future)
+                        for task in self.context
+                        if task.async_execution and task._future is not None
+                    ]
+                )
+                context = self._assemble_context()
+                self._context_cache = context
+                self._context_cache_key = self._context_key()
+
+        tools = tools or self.tools
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _TASK_POOL, self._execute, agent, self._prompt(), context, tools
+        )
+
+    def _assemble_context(self) -> str:
+        """        Assemble the context string from the context tasks' outputs.
+
+        Returns:
+            str: The newline-separated outputs of the context tasks.
+        """
+
+        return "\n".join(task.output.result for task in self.context)
+
+    def _context_key(self) -> tuple:
+        """        Build the cache key for the assembled context string.
+
+        Context tasks get a fresh TaskOutput whenever they are re-executed,
+        so output identity is enough to detect that the cached context is
+        stale. The outputs themselves are kept in the key, pinning their
+        addresses so identity checks cannot be fooled by id reuse.
+
+        Returns:
+            tuple: The TaskOutput objects of the context tasks.
+        """
+
+        return tuple(task.output for task in self.context)
+
+    def _context_cache_valid(self) -> bool:
+        """        Check whether the cached context string can be reused.
+
+        The cache is trusted only when no context task has a pending future
+        and every context task still holds the exact TaskOutput the cache
+        was assembled from.
+
+        Returns:
+            bool: True if the cached context is current, False otherwise.
+        """
+
+        if self._context_cache is None or self._context_cache_key is None:
+            return False
+        if any(
+            task.async_execution
+            and task._future is not None
+            and not task._future.done()
+            for task in self.context
+        ):
+            return False
+        key = self._context_key()
+        return len(key) == len(self._context_cache_key) and all(
+            output is cached for output, cached in zip(key, self._context_cache_key)
+        )
+
     def _execute(self, agent, task_prompt, context, tools):
         """        Execute a task using the provided agent and input parameters.
 
@@ -157,9 +306,16 @@ class Task(BaseModel):
     def _prompt(self) -> str:
         """        Prompt the task.
 
+        The formatted prompt is computed once and cached, since description
+        and expected_output are effectively frozen at runtime and retries or
+        async re-submissions call this repeatedly.
+
         Returns:
             str: Prompt of the task.
         """
+        if self._prompt_cache is not None:
+            return self._prompt_cache
+
         tasks_slices = [self.description]
 
         if self.expected_output:
@@ -167,4 +323,5 @@ class Task(BaseModel):
                 expected_output=self.expected_output
             )
             tasks_slices = [self.description, output]
-        return "\n".join(tasks_slices)
+        self._prompt_cache = "\n".join(tasks_slices)
+        return self._prompt_cache
@@ -1,15 +1,46 @@
-from typing import List
+import re
+from typing import Callable, Dict, List, Optional
 
-from langchain.tools import Tool
-from pydantic import BaseModel, Field
+from langchain.tools import BaseTool
+from pydantic import BaseModel, Field, PrivateAttr
 
 from crewai.agent import Agent
 from crewai.utilities import I18N
 
+_COMMAND_REGEX = re.compile(r"\s*([^|]+?)\s*\|\s*([^|]+?)\s*\|\s*(.+?)\s*", re.DOTALL)
+
+
+class _DelegateTool(BaseTool):
+    """Lean str -> str tool that calls its function directly.
+
+    Skips the schema inference and per-call argument validation that
+    Tool.from_function sets up, which is pure overhead for the trivial
+    command-string signature of the delegation tools.
+    """
+
+    func: Callable[[str], str]
+
+    def _run(self, command: str) -> str:
+        """        Run the wrapped function with the given command.
+
+        Args:
+            command (str): The command to be executed.
+
+        Returns:
+            str: The result of executing the command.
+        """
+
+        return self.func(command)
+
 
 class AgentTools(BaseModel):
     """Default tools around agent delegation"""
 
+    _agents_cache_key: Optional[tuple] = PrivateAttr(default=None)
+    _coworker_roles_cache: Optional[str] = PrivateAttr(default=None)
+    _tools_cache: Optional[List[BaseTool]] = PrivateAttr(default=None)
+    _by_role_cache: Optional[Dict[str, Agent]] = PrivateAttr(default=None)
+
     agents: List[Agent] = Field(description="List of agents in this crew.")
     i18n: I18N = Field(default=I18N(), description="Internationalization settings.")
 
@@ -17,6 +48,7 @@ class AgentTools(BaseModel):
         """        Return a list of tools available for the user.
 
         This method returns a list of Tool objects, each representing a specific tool available for the user to utilize.
+        The list is built once and reused until the agents list changes.
 
         Returns:
             list: A list of Tool objects.
@@ -25,22 +57,79 @@ class AgentTools(BaseModel):
              None
         """
 
-        return [
-            Tool.from_function(
-                func=self.delegate_work,
-                name="Delegate work to co-worker",
-                description=self.i18n.tools("delegate_work").format(
-                    coworkers=", ".join([agent.role for agent in self.agents])
+        self._check_agents_cache()
+        if self._tools_cache is None:
+            coworkers = self._coworker_roles()
+            self._tools_cache = [
+                _DelegateTool(
+                    func=self.delegate_work,
+                    name="Delegate work to co-worker",
+                    description=self.i18n.tools("delegate_work").format(
+                        coworkers=coworkers
+                    ),
                 ),
-            ),
-            Tool.from_function(
-                func=self.ask_question,
-                name="Ask question to co-worker",
-                description=self.i18n.tools("ask_question").format(
-                    coworkers=", ".join([agent.role for agent in self.agents])
+                _DelegateTool(
+                    func=self.ask_question,
+                    name="Ask question to co-worker",
+                    description=self.i18n.tools("ask_question").format(
+                        coworkers=coworkers
+                    ),
                 ),
-            ),
-        ]
+            ]
+        return self._tools_cache
+
+    def _coworker_roles(self) -> str:
+        """        Return the comma-separated roles of the agents in this crew.
+
+        The joined string is cached and rebuilt only when the agents list changes.
+
+        Returns:
+            str: The roles of the agents, joined by a comma.
+        """
+
+        self._check_agents_cache()
+        if self._coworker_roles_cache is None:
+            self._coworker_roles_cache = ", ".join(
+                agent.role for agent in self.agents
+            )
+        return self._coworker_roles_cache
+
+    def _by_role(self) -> Dict[str, Agent]:
+        """        Return a mapping of agent role to agent for this crew.
+
+        The mapping is cached and rebuilt only when the agents list changes.
+        When two agents share a role the first one wins, matching the
+        previous linear scan.
+
+        Returns:
+            Dict[str, Agent]: The agents in this crew keyed by their role.
+        """
+
+        self._check_agents_cache()
+        if self._by_role_cache is None:
+            by_role = {}
+            for agent in self.agents:
+                by_role.setdefault(agent.role, agent)
+            self._by_role_cache = by_role
+        return self._by_role_cache
+
+    def _check_agents_cache(self) -> None:
+        """        Invalidate cached values derived from the agents list when it changes.
+
+        The key is a retained snapshot of the agent roles rather than the
+        identity of the list object, so reassigning the list, mutating it in
+        place or changing an agent's role all invalidate the caches.
+
+        Returns:
+            None
+        """
+
+        key = tuple(agent.role for agent in self.agents)
+        if key != self._agents_cache_key:
+            self._agents_cache_key = key
+            self._coworker_roles_cache = None
+            self._tools_cache = None
+            self._by_role_cache = None
 
     def delegate_work(self, command):
         """        Useful to delegate a specific task to a coworker.
@@ -75,28 +164,19 @@ class AgentTools(BaseModel):
             str: The result of executing the command.
 
         Raises:
-            ValueError: If the command does not contain all three parts separated by "|".
-            ValueError: If any of the parts (agent, task, context) is missing in the command.
-            ValueError: If the specified agent does not exist in the list of available agents.
+             None
         """
-        try:
-            agent, task, context = command.split("|")
-        except ValueError:
+        match = _COMMAND_REGEX.fullmatch(command)
+        if not match:
             return self.i18n.errors("agent_tool_missing_param")
 
-        if not agent or not task or not context:
-            return self.i18n.errors("agent_tool_missing_param")
+        agent, task, context = match.groups()
 
-        agent = [
-            available_agent
-            for available_agent in self.agents
-            if available_agent.role == agent
-        ]
+        agent = self._by_role().get(agent)
 
         if not agent:
             return self.i18n.errors("agent_tool_unexsiting_coworker").format(
-                coworkers=", ".join([agent.role for agent in self.agents])
+                coworkers=self._coworker_roles()
             )
 
-        agent = agent[0]
         return agent.execute_task(task, context)
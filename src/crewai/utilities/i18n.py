@@ -1,3 +1,4 @@
+import functools
 import json
 import os
 from typing import Dict, Optional
@@ -5,7 +6,26 @@ from typing import Dict, Optional
 from pydantic import BaseModel, Field, PrivateAttr, ValidationError, model_validator
 
 
+@functools.lru_cache(maxsize=None)
+def _load_translations(prompts_path: str) -> Dict[str, Dict[str, str]]:
+    """    Load and cache the translations stored at the given path.
+
+    Each language file is read and parsed once per process, no matter how
+    many I18N instances are created.
+
+    Args:
+        prompts_path (str): Path of the JSON file holding the translations.
+
+    Returns:
+        Dict[str, Dict[str, str]]: The parsed translations.
+    """
+
+    with open(prompts_path, "r") as f:
+        return json.load(f)
+
+
 class I18N(BaseModel):
+    __hash__ = object.__hash__  # type: ignore
     _translations: Dict[str, Dict[str, str]] = PrivateAttr()
     language: Optional[str] = Field(
         default="en",
@@ -29,8 +49,7 @@ class I18N(BaseModel):
                 dir_path, f"../translations/{self.language}.json"
             )
 
-            with open(prompts_path, "r") as f:
-                self._translations = json.load(f)
+            self._translations = _load_translations(prompts_path)
         except FileNotFoundError:
             raise ValidationError(
                 f"Translation file for language '{self.language}' not found."
@@ -79,9 +98,14 @@ class I18N(BaseModel):
 
         return self.retrieve("tools", error)
 
+    @functools.lru_cache(maxsize=256)
     def retrieve(self, kind, key) -> str:
         """        Retrieve the translation for the given kind and key.
 
+        Lookups are memoized per instance, so hot callers such as slice,
+        errors and tools resolve repeated keys without traversing the
+        translations dict again.
+
         Args:
             kind (str): The kind of translation to retrieve.
             key (str): The key of the translation to retrieve.
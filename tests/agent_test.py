@@ -161,11 +161,9 @@ def test_cache_hitting():
 
     output = agent.execute_task("What is 2 times 6 times 3?")
     output = agent.execute_task("What is 3 times 3?")
-    assert cache_handler._cache == {
-        "multiplier-12,3": "36",
-        "multiplier-2,6": "12",
-        "multiplier-3,3": "9",
-    }
+    assert cache_handler.read("multiplier", "12,3") == "36"
+    assert cache_handler.read("multiplier", "2,6") == "12"
+    assert cache_handler.read("multiplier", "3,3") == "9"
 
     output = agent.execute_task("What is 2 times 6 times 3? Return only the number")
     assert output == "36"
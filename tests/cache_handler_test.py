@@ -0,0 +1,44 @@
+"""Test CacheHandler eviction behavior."""
+
+import pytest
+
+from crewai.agents.cache import CacheHandler, SemanticCacheHandler
+
+
+def test_cache_evicts_least_recently_used_entry():
+    cache = CacheHandler(maxsize=2)
+    cache.add("multiplier", "2,6", "12")
+    cache.add("multiplier", "3,3", "9")
+
+    assert cache.read("multiplier", "2,6") == "12"
+
+    cache.add("multiplier", "5,5", "25")
+
+    assert cache.read("multiplier", "3,3") is None
+    assert cache.read("multiplier", "2,6") == "12"
+    assert cache.read("multiplier", "5,5") == "25"
+
+
+def test_cache_expires_entries_after_ttl():
+    cache = CacheHandler(ttl=0)
+    cache.add("multiplier", "2,6", "12")
+
+    assert cache.read("multiplier", "2,6") is None
+
+
+def test_cache_keeps_entries_without_ttl():
+    cache = CacheHandler(ttl=None)
+    cache.add("multiplier", "2,6", "12")
+
+    assert cache.read("multiplier", "2,6") == "12"
+
+
+def test_semantic_cache_requires_optional_dependencies():
+    try:
+        import faiss  # noqa: F401
+        import sentence_transformers  # noqa: F401
+    except ImportError:
+        with pytest.raises(ImportError, match="faiss-cpu"):
+            SemanticCacheHandler()
+    else:
+        pytest.skip("optional semantic cache dependencies are installed")
@@ -310,7 +310,7 @@ def test_cache_hitting_between_agents():
 
     assert crew._cache_handler._cache == {}
     output = crew.kickoff()
-    assert crew._cache_handler._cache == {"multiplier-2,6": "12"}
+    assert crew._cache_handler.read("multiplier", "2,6") == "12"
     assert output == "12"
 
     with patch.object(CacheHandler, "read") as read:
@@ -357,9 +357,10 @@ def test_api_calls_throttling(capsys):
 
 
 def test_async_task_execution():
-    import threading
+    import concurrent.futures
     from unittest.mock import patch
 
+    import crewai.task
     from crewai.tasks.task_output import TaskOutput
 
     list_ideas = Task(
@@ -389,16 +390,16 @@ def test_async_task_execution():
 
     with patch.object(Agent, "execute_task") as execute:
         execute.return_value = "ok"
-        with patch.object(threading.Thread, "start") as start:
-            thread = threading.Thread(target=lambda: None, args=()).start()
-            start.return_value = thread
-            with patch.object(threading.Thread, "join", wraps=thread.join()) as join:
-                list_ideas.output = TaskOutput(
-                    description="A 4 paragraph article about AI.", result="ok"
-                )
-                list_important_history.output = TaskOutput(
-                    description="A 4 paragraph article about AI.", result="ok"
-                )
-                crew.kickoff()
-                start.assert_called()
-                join.assert_called()
+        future = concurrent.futures.Future()
+        future.set_result("ok")
+        with patch.object(
+            crewai.task._TASK_POOL, "submit", return_value=future
+        ) as submit:
+            list_ideas.output = TaskOutput(
+                description="A 4 paragraph article about AI.", result="ok"
+            )
+            list_important_history.output = TaskOutput(
+                description="A 4 paragraph article about AI.", result="ok"
+            )
+            crew.kickoff()
+            assert submit.call_count == 2
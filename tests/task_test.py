@@ -135,4 +135,64 @@ def test_async_execution():
 
     with patch.object(Agent, "execute_task", return_value="ok") as execute:
         task.execute(agent=researcher)
+        assert task.result(timeout=10) == "ok"
         execute.assert_called_once_with(task=task._prompt(), context=None, tools=[])
+
+
+def test_aexecute():
+    import asyncio
+
+    researcher = Agent(
+        role="Researcher",
+        goal="Make the best research and analysis on content about AI and AI agents",
+        backstory="You're an expert researcher, specialized in technology, software engineering, AI and startups. You work as a freelancer and is now working on doing research and analysis for a new customer.",
+        allow_delegation=False,
+    )
+
+    task = Task(
+        description="Give me a list of 5 interesting ideas to explore for na article, what makes them unique and interesting.",
+        expected_output="Bullet point list of 5 interesting ideas.",
+        agent=researcher,
+    )
+
+    with patch.object(Agent, "execute_task", return_value="ok") as execute:
+        result = asyncio.run(task.aexecute())
+        assert result == "ok"
+        execute.assert_called_once_with(task=task._prompt(), context=None, tools=[])
+
+
+def test_context_is_cached_between_retries():
+    from crewai.tasks.task_output import TaskOutput
+
+    researcher = Agent(
+        role="Researcher",
+        goal="Make the best research and analysis on content about AI and AI agents",
+        backstory="You're an expert researcher, specialized in technology, software engineering, AI and startups. You work as a freelancer and is now working on doing research and analysis for a new customer.",
+        allow_delegation=False,
+    )
+
+    list_ideas = Task(
+        description="Give me a list of 5 interesting ideas to explore for na article, what makes them unique and interesting.",
+        expected_output="Bullet point list of 5 important events.",
+        agent=researcher,
+    )
+    list_ideas.output = TaskOutput(description="Ideas", result="idea list")
+
+    write_article = Task(
+        description="Write an article about the history of AI and its most important events.",
+        expected_output="A 4 paragraph article about AI.",
+        agent=researcher,
+        context=[list_ideas],
+    )
+
+    with patch.object(Agent, "execute_task", return_value="ok"):
+        with patch.object(
+            Task, "_assemble_context", return_value="idea list"
+        ) as assemble:
+            write_article.execute()
+            write_article.execute()
+            assert assemble.call_count == 1
+
+            list_ideas.output = TaskOutput(description="Ideas", result="new list")
+            write_article.execute()
+            assert assemble.call_count == 2